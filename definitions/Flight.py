@@ -1,7 +1,14 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from .FlightPlan import FlightPlan
 
+# Integer codes of the wake turbulence categories; flights store the code, not the string
+_WAKE_CODES = {'Light': 0, 'Medium': 1, 'Heavy': 2, 'Super': 3}
+_WAKE_CATEGORIES = tuple(_WAKE_CODES)
+_VALID_WAKE = frozenset(_WAKE_CODES)
+
 class Flight:
+    __slots__ = ('_callsign', '_airline', '_aircraft', '_wake_code', '_cost_index', '_filed_plans')
+
     def __init__(
         self,
         callsign: str,
@@ -26,15 +33,14 @@ class Flight:
         self._airline = airline
         self._aircraft = aircraft
         self._validate_wake_category(wake_turbulence_cat)
-        self._wake_turbulence_cat = wake_turbulence_cat
+        self._wake_code = _WAKE_CODES[wake_turbulence_cat]
         self._cost_index = float(cost_index)
-        self._filed_plans = filed_plans if filed_plans is not None else []
+        self._filed_plans = list(filed_plans) if filed_plans is not None else []
 
     def _validate_wake_category(self, category: str):
         """Validate the wake turbulence category."""
-        valid_categories = {'Light', 'Medium', 'Heavy', 'Super'}
-        if category not in valid_categories:
-            raise ValueError(f"Wake turbulence category must be one of {valid_categories}")
+        if category not in _VALID_WAKE:
+            raise ValueError(f"Wake turbulence category must be one of {_WAKE_CATEGORIES}")
 
     @property
     def callsign(self) -> str:
@@ -54,7 +60,12 @@ class Flight:
     @property
     def wake_turbulence_cat(self) -> str:
         """Get the wake turbulence category."""
-        return self._wake_turbulence_cat
+        return _WAKE_CATEGORIES[self._wake_code]
+
+    @property
+    def wake_code(self) -> int:
+        """Get the integer code of the wake turbulence category."""
+        return self._wake_code
 
     @property
     def cost_index(self) -> float:
@@ -62,9 +73,9 @@ class Flight:
         return self._cost_index
 
     @property
-    def filed_plans(self) -> List[FlightPlan]:
-        """Get the list of filed flight plans."""
-        return self._filed_plans.copy()
+    def filed_plans(self) -> Tuple[FlightPlan, ...]:
+        """Get the filed flight plans as an immutable tuple."""
+        return tuple(self._filed_plans)
 
     def add_flight_plan(self, flight_plan: FlightPlan):
         """
@@ -77,12 +88,14 @@ class Flight:
 
     def __str__(self) -> str:
         """Return a string representation of the flight."""
-        return (f"Flight {self._callsign}\n"
-                f"Airline: {self._airline}\n"
-                f"Aircraft: {self._aircraft}\n"
-                f"Wake Category: {self._wake_turbulence_cat}\n"
-                f"Cost Index: {self._cost_index}\n"
-                f"Number of Filed Plans: {len(self._filed_plans)}")
+        return "\n".join((
+            f"Flight {self._callsign}",
+            f"Airline: {self._airline}",
+            f"Aircraft: {self._aircraft}",
+            f"Wake Category: {self.wake_turbulence_cat}",
+            f"Cost Index: {self._cost_index}",
+            f"Number of Filed Plans: {len(self._filed_plans)}"
+        ))
 
 # Example usage:
 # flight = Flight(
@@ -1,7 +1,64 @@
 import numpy as np
 from typing import List, Union
 
+# Unit conversions to SI
+KNOTS_TO_MPS = 0.514444
+FLIGHT_LEVEL_TO_M = 30.48  # One flight level is 100 ft
+
+_ALTITUDE_LIMITS = np.iinfo(np.int16)
+
+
+def _readonly_view(array: np.ndarray) -> np.ndarray:
+    """Return a view of the array that cannot be written through."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _detach(array: np.ndarray, source) -> np.ndarray:
+    """Copy the array if it still shares memory with a writeable source ndarray, so the caller cannot change it later."""
+    if isinstance(source, np.ndarray) and source.flags.writeable and np.shares_memory(array, source):
+        return array.copy()
+    return array
+
+
+def _check_waypoint_bounds(waypoints: np.ndarray):
+    """Check that a non-empty (n, 2) [longitude, latitude] array is within bounds."""
+    # One min/max reduction per column checks both bounds; NaNs fail the comparisons
+    lower = waypoints.min(axis=0)
+    upper = waypoints.max(axis=0)
+    if not (-180 <= lower[0] and upper[0] <= 180):
+        raise ValueError("Longitude must be between -180 and 180 degrees")
+    if not (-90 <= lower[1] and upper[1] <= 90):
+        raise ValueError("Latitude must be between -90 and 90 degrees")
+
+
+def _to_altitude_array(altitudes) -> np.ndarray:
+    """
+    Convert flight levels to int16, rejecting values that are not integers in the int16 range.
+    
+    Args:
+        altitudes: Flight levels, as a list or array
+        
+    Returns:
+        The flight levels as an int16 array
+    """
+    altitudes = np.asarray(altitudes)
+    if altitudes.dtype.kind not in 'biuf':
+        raise ValueError("Altitudes must be numeric flight levels")
+    if altitudes.size:
+        # NaNs fail the integrality check, infinities the range check
+        if altitudes.dtype.kind == 'f' and not np.all(np.floor(altitudes) == altitudes):
+            raise ValueError("Altitudes must be integer flight levels")
+        if altitudes.min() < _ALTITUDE_LIMITS.min or altitudes.max() > _ALTITUDE_LIMITS.max:
+            raise ValueError(f"Altitudes must be between {_ALTITUDE_LIMITS.min} and {_ALTITUDE_LIMITS.max}")
+    return altitudes.astype(np.int16, copy=False)
+
+
 class FlightPlan:
+    __slots__ = ('_waypoints', '_altitudes', '_speeds', '_aircraft_category', '_delay_allowance', '_preference_rank',
+                 '_speeds_mps', '_altitudes_m')
+
     def __init__(
         self,
         waypoints: Union[List[List[float]], np.ndarray],
@@ -21,32 +78,66 @@ class FlightPlan:
             aircraft_category: Aircraft category string
             delay_allowance: Maximum allowed delay in seconds
             preference_rank: Rank of preference (lower is more preferred)
+        
+        Writeable input arrays are copied, so later changes to them cannot bypass
+        validation; read-only arrays of the right dtype are used without copying.
         """
-        self._waypoints = np.array(waypoints)
+        self._waypoints = _detach(np.asarray(waypoints, dtype=np.float32), waypoints)
         self._validate_waypoints()
         
-        self._altitudes = np.array(altitudes)
-        self._speeds = np.array(speeds)
+        self._altitudes = _detach(_to_altitude_array(altitudes), altitudes)
+        self._speeds = _detach(np.asarray(speeds, dtype=np.float32), speeds)
         self._validate_dimensions()
         
         self._aircraft_category = aircraft_category
         self._delay_allowance = max(0, delay_allowance)  # Cannot be negative
         self._preference_rank = max(1, int(preference_rank))  # Minimum rank is 1
+        
+        # SI versions of speeds and altitudes, computed on first access
+        self._speeds_mps = None
+        self._altitudes_m = None
 
+    @classmethod
+    def _from_arrays(
+        cls,
+        waypoints: np.ndarray,
+        altitudes: np.ndarray,
+        speeds: np.ndarray,
+        aircraft_category: str,
+        delay_allowance: float = 0,
+        preference_rank: int = 1
+    ) -> 'FlightPlan':
+        """
+        Create a FlightPlan around already validated arrays, without copying or checking them.
         
+        Used by bulk loaders that validate all plans at once; the arrays must already
+        have the dtypes and shapes that __init__ would produce.
+        """
+        plan = cls.__new__(cls)
+        plan._waypoints = waypoints
+        plan._altitudes = altitudes
+        plan._speeds = speeds
+        plan._aircraft_category = aircraft_category
+        plan._delay_allowance = max(0, delay_allowance)  # Cannot be negative
+        plan._preference_rank = max(1, int(preference_rank))  # Minimum rank is 1
+        plan._speeds_mps = None
+        plan._altitudes_m = None
+        return plan
     
     def _validate_waypoints(self):
         """Validate waypoints format and values."""
-        if self._waypoints.shape[1] != 2:
+        if self._waypoints.shape == (0,):
+            # An empty list of waypoints
+            self._waypoints = self._waypoints.reshape(0, 2)
+        
+        # Check the shape before indexing columns, so 1-D or 3-D input gives a clear error
+        if self._waypoints.ndim != 2 or self._waypoints.shape[1] != 2:
             raise ValueError("Waypoints must be a n x 2 matrix")
         
-        # Check longitude bounds (-180 to 180)
-        if not np.all((-180 <= self._waypoints[:, 0]) & (self._waypoints[:, 0] <= 180)):
-            raise ValueError("Longitude must be between -180 and 180 degrees")
+        if len(self._waypoints) == 0:
+            return
         
-        # Check latitude bounds (-90 to 90)
-        if not np.all((-90 <= self._waypoints[:, 1]) & (self._waypoints[:, 1] <= 90)):
-            raise ValueError("Latitude must be between -90 and 90 degrees")
+        _check_waypoint_bounds(self._waypoints)
     
     def _validate_dimensions(self):
         """Validate that altitudes and speeds match waypoints length."""
@@ -58,18 +149,32 @@ class FlightPlan:
     
     @property
     def waypoints(self) -> np.ndarray:
-        """Get the waypoints array."""
-        return self._waypoints.copy()
+        """Get the waypoints array (read-only view)."""
+        return _readonly_view(self._waypoints)
     
     @property
     def altitudes(self) -> np.ndarray:
-        """Get the flight levels array."""
-        return self._altitudes.copy()
+        """Get the flight levels array (read-only view)."""
+        return _readonly_view(self._altitudes)
     
     @property
     def speeds(self) -> np.ndarray:
-        """Get the speeds array in knots."""
-        return self._speeds.copy()
+        """Get the speeds array in knots (read-only view)."""
+        return _readonly_view(self._speeds)
+    
+    @property
+    def speeds_mps(self) -> np.ndarray:
+        """Get the speeds array in m/s (read-only view, computed once)."""
+        if self._speeds_mps is None:
+            self._speeds_mps = self._speeds * np.float32(KNOTS_TO_MPS)
+        return _readonly_view(self._speeds_mps)
+    
+    @property
+    def altitudes_m(self) -> np.ndarray:
+        """Get the altitudes array in meters (read-only view, computed once)."""
+        if self._altitudes_m is None:
+            self._altitudes_m = self._altitudes.astype(np.float32) * np.float32(FLIGHT_LEVEL_TO_M)
+        return _readonly_view(self._altitudes_m)
     
     @property
     def aircraft_category(self) -> str:
@@ -92,10 +197,12 @@ class FlightPlan:
     
     def __str__(self) -> str:
         """Return a string representation of the flight plan."""
-        return (f"FlightPlan with {len(self)} waypoints\n"
-                f"Aircraft Category: {self._aircraft_category}\n"
-                f"Delay Allowance: {self._delay_allowance} seconds\n"
-                f"Preference Rank: {self._preference_rank}")
+        return "\n".join((
+            f"FlightPlan with {len(self)} waypoints",
+            f"Aircraft Category: {self._aircraft_category}",
+            f"Delay Allowance: {self._delay_allowance} seconds",
+            f"Preference Rank: {self._preference_rank}"
+        ))
 
 
 # Example usage
@@ -1,14 +1,52 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import numpy as np
 from .Flight import Flight
-from .Sector import Sector
+from .FlightPlan import FLIGHT_LEVEL_TO_M, KNOTS_TO_MPS, FlightPlan, _check_waypoint_bounds, _to_altitude_array
+from .Sector import Sector, _to_capacity_array
+try:
+    # Ahead-of-time compiled kernels, built by _kernels_aot.py
+    from .spearhead_kernels import bulk_set, classify_points as _classify_points
+except ImportError:
+    from ._kernels import bulk_set, classify_points as _classify_points
 
 from dotenv import load_dotenv
 import os
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    # PyYAML was built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import shapely
+    from shapely.strtree import STRtree
+except ImportError:
+    # Shapely is only needed for the STRtree sector index
+    shapely = None
 
 load_dotenv()
 
 DEBUG_LEVEL = int(os.getenv('DEBUG_LEVEL', '0'))
+PROJECT_ROOT = os.getenv('PROJECT_ROOT')
+
+# Parsed scenario files, keyed by path and holding ((mtime in ns, size), data)
+_SCENARIO_CACHE: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+
+
+def _flight_table_dtype(callsign_width: int) -> np.dtype:
+    """Row layout of Scenario.flight_table, with the callsign field sized to the longest callsign."""
+    return np.dtype([('callsign', f'U{max(callsign_width, 1)}'), ('wake', 'i1'), ('cost_index', 'f4'), ('n_plans', 'i4')])
+
+
+def _offsets(counts: List[int]) -> np.ndarray:
+    """Turn a list of segment lengths into CSR-style (n + 1,) int32 offsets."""
+    offsets = np.zeros(len(counts) + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum(counts)
+    return offsets
+
 
 class Scenario:
     """
@@ -20,6 +58,21 @@ class Scenario:
         sectors (List[Sector]): List of sectors in the scenario
         datetime (str): Optional timestamp for the scenario
         author (str): Optional author of the scenario
+        flight_table (np.ndarray): Structured array of flight metadata, built on first access
+
+    Columnar (SoA) attributes, populated by build_columns():
+        callsigns (np.ndarray): Flight callsigns, one per flight
+        cost_index (np.ndarray): float32 cost index, one per flight
+        wake_cat (np.ndarray): int8 wake turbulence category code, one per flight
+        flight_offsets (np.ndarray): (n_flights + 1,) int32 offsets into the plans
+        all_waypoints (np.ndarray): (M, 2) float32 [longitude, latitude] of all plans
+        all_altitudes (np.ndarray): (M,) int16 flight levels of all plans
+        all_speeds (np.ndarray): (M,) float32 speeds in knots of all plans
+        all_altitudes_m (np.ndarray): (M,) float32 altitudes in meters of all plans
+        all_speeds_mps (np.ndarray): (M,) float32 speeds in m/s of all plans
+        plan_offsets (np.ndarray): (n_plans + 1,) int32 offsets into the waypoints
+        aircraft_categories (np.ndarray): Sorted aircraft categories seen in the plans
+        plan_category (np.ndarray): int8 index into aircraft_categories, one per plan
     """
     
     def __init__(
@@ -41,10 +94,285 @@ class Scenario:
             author: Optional author name
         """
         self.name = name
-        self.flights = flights if flights is not None else []
-        self.sectors = sectors if sectors is not None else []
+        self.flights = list(flights) if flights is not None else []
+        self.sectors = list(sectors) if sectors is not None else []
         self.datetime = datetime_str
         self.author = author
+        self._reset_columns()
+        self._reset_sector_caches()
+
+    def _reset_columns(self) -> None:
+        """Drop the columnar arrays so that they are rebuilt on next use."""
+        self.callsigns = None
+        self.cost_index = None
+        self.wake_cat = None
+        self.flight_offsets = None
+        self.all_waypoints = None
+        self.all_altitudes = None
+        self.all_speeds = None
+        self.all_altitudes_m = None
+        self.all_speeds_mps = None
+        self.plan_offsets = None
+        self.aircraft_categories = None
+        self.plan_category = None
+        self._flight_table = None
+
+    @property
+    def flight_table(self) -> np.ndarray:
+        """
+        Structured array with one row per flight, for vectorized queries over flights.
+        
+        Fields are callsign, wake (wake category code),
+        cost_index and n_plans. Built on first access and reset by add_flight.
+        """
+        if self._flight_table is None:
+            callsign_width = max((len(f._callsign) for f in self.flights), default=1)
+            self._flight_table = np.fromiter(
+                ((f._callsign, f._wake_code, f._cost_index, len(f._filed_plans)) for f in self.flights),
+                dtype=_flight_table_dtype(callsign_width),
+                count=len(self.flights)
+            )
+        return self._flight_table
+
+    def filter(self, mask: np.ndarray) -> np.ndarray:
+        """
+        Get the indices of the flights selected by a boolean mask.
+        
+        The mask is typically built from flight_table, e.g.
+        (table['wake'] == wake_code) & (table['cost_index'] > 30).
+        
+        Args:
+            mask: Boolean array with one entry per flight
+            
+        Returns:
+            Indices into self.flights of the selected flights
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self.flights),):
+            raise ValueError("Mask must have one entry per flight")
+        return np.flatnonzero(mask)
+
+    def build_columns(self) -> None:
+        """
+        Build the columnar (SoA) arrays over all flights and their filed plans.
+        
+        The plans of flight i are plans flight_offsets[i] to flight_offsets[i + 1]
+        (in filing order), and the waypoints of plan p are
+        all_waypoints[plan_offsets[p]:plan_offsets[p + 1]]. Bulk computations can
+        then work on (all_waypoints, plan_offsets) instead of looping over flights.
+        
+        The columns are a snapshot of the flights: add_flight resets them, and they
+        must be rebuilt after flights or flight plans are modified in place.
+        """
+        # The flight table is part of the same snapshot
+        self._flight_table = None
+        plan_counts = []
+        plans = []
+        for flight in self.flights:
+            plan_counts.append(len(flight._filed_plans))
+            plans.extend(flight._filed_plans)
+
+        self._build_flight_columns()
+        categories = [plan.aircraft_category for plan in plans]
+        if plans:
+            self._set_plan_columns(
+                _offsets(plan_counts),
+                categories,
+                _offsets([len(plan) for plan in plans]),
+                np.concatenate([plan._waypoints for plan in plans]),
+                np.concatenate([plan._altitudes for plan in plans]),
+                np.concatenate([plan._speeds for plan in plans])
+            )
+        else:
+            self._set_plan_columns(
+                _offsets(plan_counts),
+                categories,
+                _offsets([]),
+                np.empty((0, 2), dtype=np.float32),
+                np.empty(0, dtype=np.int16),
+                np.empty(0, dtype=np.float32)
+            )
+
+    def _build_flight_columns(self) -> None:
+        """Build the per-flight columns (callsigns, cost_index, wake_cat) as contiguous arrays."""
+        callsigns = []
+        cost_index = []
+        wake_cat = []
+        for flight in self.flights:
+            callsigns.append(flight._callsign)
+            cost_index.append(flight._cost_index)
+            wake_cat.append(flight._wake_code)
+
+        self.callsigns = np.array(callsigns, dtype=str)
+        self.cost_index = np.array(cost_index, dtype=np.float32)
+        self.wake_cat = np.array(wake_cat, dtype=np.int8)
+
+    def _set_plan_columns(
+        self,
+        flight_offsets: np.ndarray,
+        categories: List[str],
+        plan_offsets: np.ndarray,
+        waypoints: np.ndarray,
+        altitudes: np.ndarray,
+        speeds: np.ndarray
+    ) -> None:
+        """Store the per-plan and flat per-waypoint columns together with their CSR-style offsets."""
+        aircraft_categories, plan_category = np.unique(np.array(categories, dtype=str), return_inverse=True)
+        if len(aircraft_categories) > np.iinfo(np.int8).max + 1:
+            raise ValueError(f"At most {np.iinfo(np.int8).max + 1} distinct aircraft categories are supported")
+        self.aircraft_categories = aircraft_categories
+        self.plan_category = plan_category.astype(np.int8)
+        self.flight_offsets = flight_offsets
+        self.plan_offsets = plan_offsets
+        self.all_waypoints = waypoints
+        self.all_altitudes = altitudes
+        self.all_speeds = speeds
+        # Unit conversions done once over the flat arrays
+        self.all_altitudes_m = altitudes.astype(np.float32) * np.float32(FLIGHT_LEVEL_TO_M)
+        self.all_speeds_mps = speeds * np.float32(KNOTS_TO_MPS)
+
+    def _reset_sector_caches(self) -> None:
+        """Drop the packed sector polygons and capacity matrix so that they are rebuilt on next use."""
+        self._sector_polys_flat = None
+        self._sector_poly_offsets = None
+        self._sector_bboxes = None
+        self._stree = None
+        self._stree_sectors = None
+        self._capacity_matrix = None
+
+    def _pack_sector_polygons(self) -> None:
+        """Concatenate the sector polygons into one (K, 2) buffer with CSR-style offsets, plus their bounding boxes."""
+        polygons = [sector.polygon_np for sector in self.sectors]
+        self._sector_bboxes = np.array([sector.get_bbox() for sector in self.sectors], dtype=np.float32).reshape(-1, 4)
+        self._sector_poly_offsets = _offsets([len(polygon) for polygon in polygons])
+        if polygons:
+            self._sector_polys_flat = np.concatenate(polygons)
+        else:
+            self._sector_polys_flat = np.empty((0, 2), dtype=np.float32)
+
+    def classify_waypoints(self) -> np.ndarray:
+        """
+        Find the sector containing each waypoint of the columnar waypoint table.
+        
+        Builds the columns (see build_columns) if they are not available yet.
+        
+        Returns:
+            (M,) int32 array aligned with all_waypoints, holding the index in
+            self.sectors of the first sector containing the waypoint, or -1
+        """
+        if self.all_waypoints is None:
+            self.build_columns()
+        if self._sector_polys_flat is None:
+            self._pack_sector_polygons()
+
+        # Waypoints are (longitude, latitude) while sector polygons are (latitude, longitude)
+        pts = np.ascontiguousarray(self.all_waypoints[:, ::-1])
+        out = np.empty(len(pts), dtype=np.int32)
+        _classify_points(pts, self._sector_polys_flat, self._sector_poly_offsets, self._sector_bboxes, out)
+        return out
+
+    def _build_spatial_index(self) -> None:
+        """
+        Build a Shapely STRtree over the sector polygons.
+        
+        Sectors whose polygon has fewer than three distinct vertices are left out,
+        since Shapely cannot build a polygon from them. _stree_sectors maps each
+        tree index back to its index in self.sectors.
+        """
+        if shapely is None:
+            raise ImportError("The STRtree sector index requires shapely")
+
+        polygons = []
+        sector_idx = []
+        for i, sector in enumerate(self.sectors):
+            vertices = sector.polygon_np
+            # Shapely closes open rings and needs at least 4 coordinates once closed
+            n_closed = len(vertices) + (len(vertices) > 0 and not np.array_equal(vertices[0], vertices[-1]))
+            if n_closed < 4:
+                continue
+            # Shapely geometries are (x, y) = (longitude, latitude)
+            polygons.append(shapely.Polygon(vertices[:, ::-1]))
+            sector_idx.append(i)
+        self._stree = STRtree(polygons)
+        self._stree_sectors = np.array(sector_idx, dtype=np.intp)
+
+    def sectors_containing(self, lat: float, lon: float) -> List[Sector]:
+        """
+        Find the sectors containing a point, using the STRtree spatial index.
+        
+        Args:
+            lat: Latitude of the point
+            lon: Longitude of the point
+            
+        Returns:
+            List of the Sector objects containing the point, in scenario order
+        """
+        sector_idx = self.classify_points([lat], [lon])[1]
+        return [self.sectors[i] for i in np.sort(sector_idx)]
+
+    def classify_points(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Find the sectors containing each of many points, using the STRtree spatial index.
+        
+        Args:
+            lats: Latitudes of the points
+            lons: Longitudes of the points
+            
+        Returns:
+            (2, K) array of (point index, sector index) pairs, one per containing sector
+        """
+        if self._stree is None:
+            self._build_spatial_index()
+        pairs = self._stree.query(shapely.points(lons, lats), predicate='within')
+        pairs[1] = self._stree_sectors[pairs[1]]
+        return pairs
+
+    @property
+    def capacity_matrix(self) -> np.ndarray:
+        """
+        (n_sectors, 96) int16 capacity matrix with one row per sector.
+        
+        Built on first access. Each sector's capacity is then rebound to a view of
+        its row, so updates made through either one are visible in both.
+        """
+        if self._capacity_matrix is None:
+            matrix = np.zeros((len(self.sectors), 96), dtype=np.int16)
+            for i, sector in enumerate(self.sectors):
+                matrix[i] = sector.capacity
+                sector.capacity = matrix[i]
+            self._capacity_matrix = matrix
+        return self._capacity_matrix
+
+    def set_capacities(self, sector_idx: np.ndarray, time_idx: np.ndarray, values: np.ndarray) -> None:
+        """
+        Set many capacity slots at once.
+        
+        The indices are validated once for the whole batch instead of per slot.
+        
+        Args:
+            sector_idx: Indices into self.sectors
+            time_idx: Indices (0-95) representing the 15-minute time slots
+            values: The capacity values to set
+        """
+        sector_idx = np.asarray(sector_idx)
+        time_idx = np.asarray(time_idx)
+        # An empty list comes out as float64 and is accepted
+        if sector_idx.size and sector_idx.dtype.kind not in 'iu':
+            raise ValueError("Sector indices must be integers")
+        if time_idx.size and time_idx.dtype.kind not in 'iu':
+            raise ValueError("Time indices must be integers")
+        sector_idx = sector_idx.astype(np.int64, copy=False)
+        time_idx = time_idx.astype(np.int64, copy=False)
+        values = _to_capacity_array(values)
+        if not len(sector_idx) == len(time_idx) == len(values):
+            raise ValueError("sector_idx, time_idx and values must have the same length")
+        if len(values) == 0:
+            return
+        if sector_idx.min() < 0 or sector_idx.max() >= len(self.sectors):
+            raise ValueError(f"Sector index must be between 0 and {len(self.sectors) - 1}")
+        if time_idx.min() < 0 or time_idx.max() >= 96:
+            raise ValueError("Time index must be between 0 and 95")
+        bulk_set(self.capacity_matrix, sector_idx, time_idx, values)
 
     def add_flight(self, flight: Flight) -> None:
         """
@@ -54,6 +382,7 @@ class Scenario:
             flight: Flight object to add
         """
         self.flights.append(flight)
+        self._reset_columns()
 
     def add_sector(self, sector: Sector) -> None:
         """
@@ -63,32 +392,35 @@ class Scenario:
             sector: Sector object to add
         """
         self.sectors.append(sector)
+        self._reset_sector_caches()
 
-    def get_flights(self) -> List[Flight]:
+    def get_flights(self) -> Tuple[Flight, ...]:
         """
         Get all flights in the scenario.
         
         Returns:
-            List of Flight objects
+            Tuple of Flight objects
         """
-        return self.flights.copy()
+        return tuple(self.flights)
 
-    def get_sectors(self) -> List[Sector]:
+    def get_sectors(self) -> Tuple[Sector, ...]:
         """
         Get all sectors in the scenario.
         
         Returns:
-            List of Sector objects
+            Tuple of Sector objects
         """
-        return self.sectors.copy()
+        return tuple(self.sectors)
 
     def __str__(self) -> str:
         """String representation of the Scenario."""
-        return (f"Scenario: {self.name}\n"
-                f"Number of flights: {len(self.flights)}\n"
-                f"Number of sectors: {len(self.sectors)}\n"
-                f"Datetime: {self.datetime or 'Not specified'}\n"
-                f"Author: {self.author or 'Not specified'}")
+        return "\n".join((
+            f"Scenario: {self.name}",
+            f"Number of flights: {len(self.flights)}",
+            f"Number of sectors: {len(self.sectors)}",
+            f"Datetime: {self.datetime or 'Not specified'}",
+            f"Author: {self.author or 'Not specified'}"
+        ))
 
     def __repr__(self) -> str:
         """Detailed string representation of the Scenario."""
@@ -110,34 +442,118 @@ class Scenario:
 # scenario.add_flight(flight)
 # scenario.add_sector(sector)
 
-import numpy as np
-from .FlightPlan import FlightPlan
+def _read_scenario_file(scenario_path: str) -> dict:
+    """
+    Parse a scenario YAML file, reusing the cached result while its mtime and size are unchanged.
+    
+    Args:
+        scenario_path: Full path to the YAML file
+        
+    Returns:
+        The parsed YAML document
+    """
+    # The size catches rewrites within the filesystem's timestamp resolution
+    stat = os.stat(scenario_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _SCENARIO_CACHE.get(scenario_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    with open(scenario_path, 'r') as f:
+        scenario_data = yaml.load(f, Loader=_YamlLoader)
+    _SCENARIO_CACHE[scenario_path] = (signature, scenario_data)
+    return scenario_data
 
-def load_scenario_from_file(file_name: str) -> Scenario:
+def _load_flights_trusted(scenario: Scenario, flights_data: List[dict]) -> None:
+    """
+    Add the flights of a trusted scenario file in bulk.
+    
+    The waypoints, altitudes and speeds of all plans are converted to flat arrays
+    at once and checked with a single global validation instead of one per
+    FlightPlan. Each FlightPlan holds views into the flat arrays, which also
+    become the columnar arrays of the scenario.
+    
+    Args:
+        scenario: Scenario to add the flights to
+        flights_data: The 'flights' entries of the parsed YAML file
+    """
+    waypoints_list = []
+    altitudes_list = []
+    speeds_list = []
+    plan_sizes = []
+    plan_counts = []
+    categories = []
+    for flight_data in flights_data:
+        plans_data = flight_data.get('filed_plans', [])
+        plan_counts.append(len(plans_data))
+        for plan_data in plans_data:
+            waypoints_list.extend(plan_data['waypoints'])
+            altitudes_list.extend(plan_data['altitudes'])
+            speeds_list.extend(plan_data['speeds'])
+            plan_sizes.append((len(plan_data['waypoints']), len(plan_data['altitudes']), len(plan_data['speeds'])))
+            categories.append(plan_data['aircraft_category'])
+    
+    waypoints = np.asarray(waypoints_list, dtype=np.float32)
+    altitudes = _to_altitude_array(altitudes_list)
+    speeds = np.asarray(speeds_list, dtype=np.float32)
+    plan_sizes = np.array(plan_sizes, dtype=np.int32).reshape(-1, 3)
+    
+    # Global validation of all plans at once
+    if len(waypoints) == 0:
+        waypoints = waypoints.reshape(0, 2)
+    elif waypoints.ndim != 2 or waypoints.shape[1] != 2:
+        raise ValueError("Waypoints must be a n x 2 matrix")
+    else:
+        _check_waypoint_bounds(waypoints)
+    if (plan_sizes[:, 1] != plan_sizes[:, 0]).any():
+        raise ValueError("Number of altitudes must match number of waypoints")
+    if (plan_sizes[:, 2] != plan_sizes[:, 0]).any():
+        raise ValueError("Number of speeds must match number of waypoints")
+    
+    plan_offsets = _offsets(plan_sizes[:, 0])
+    plan_index = 0
+    for flight_data in flights_data:
+        flight = Flight(
+            callsign=flight_data['callsign'],
+            airline=flight_data['airline'],
+            aircraft=flight_data['aircraft'],
+            wake_turbulence_cat=flight_data['wake_turbulence_cat'],
+            cost_index=flight_data['cost_index']
+        )
+        for plan_data in flight_data.get('filed_plans', []):
+            start, end = plan_offsets[plan_index], plan_offsets[plan_index + 1]
+            flight.add_flight_plan(FlightPlan._from_arrays(
+                waypoints=waypoints[start:end],
+                altitudes=altitudes[start:end],
+                speeds=speeds[start:end],
+                aircraft_category=plan_data['aircraft_category'],
+                delay_allowance=plan_data.get('delay_allowance', 0),
+                preference_rank=plan_data.get('preference_rank', 1)
+            ))
+            plan_index += 1
+        # Bypass add_flight, which would reset the columns for every flight
+        scenario.flights.append(flight)
+    
+    scenario._build_flight_columns()
+    scenario._set_plan_columns(_offsets(plan_counts), categories, plan_offsets, waypoints, altitudes, speeds)
+
+def load_scenario_from_file(file_name: str, trusted: bool = False) -> Scenario:
     """
     Load a scenario from a YAML file.
     
     Args:
         file_name: Name of the YAML file in the scenarios directory
+        trusted: If True, build all flight plans in bulk with one global validation
+            instead of validating each FlightPlan (see _load_flights_trusted)
         
     Returns:
         Scenario object populated with data from the file
     """
-    from dotenv import load_dotenv
-    import os
-    import yaml
-    from datetime import datetime
-
-    # Load environment variables
-    load_dotenv()
-    project_root = os.getenv('PROJECT_ROOT')
-    
     # Construct full path to scenario file
-    scenario_path = os.path.join(project_root, 'scenarios', file_name)
+    scenario_path = os.path.join(PROJECT_ROOT, 'scenarios', file_name)
     
     # Read and parse YAML file
-    with open(scenario_path, 'r') as f:
-        scenario_data = yaml.safe_load(f)
+    scenario_data = _read_scenario_file(scenario_path)
     
     # Create scenario object with basic info
     scenario = Scenario(
@@ -147,7 +563,9 @@ def load_scenario_from_file(file_name: str) -> Scenario:
     )
     
     # Load flights if present
-    if 'flights' in scenario_data:
+    if 'flights' in scenario_data and trusted:
+        _load_flights_trusted(scenario, scenario_data['flights'])
+    elif 'flights' in scenario_data:
         for flight_data in scenario_data['flights']:
             flight = Flight(
                 callsign=flight_data['callsign'],
@@ -172,7 +590,7 @@ def load_scenario_from_file(file_name: str) -> Scenario:
                     
             scenario.add_flight(flight)
     
-    if DEBUG_LEVEL >= 2:
+    if __debug__ and DEBUG_LEVEL >= 2:
         print(f'Loaded scenario from {file_name}. There were {len(scenario.flights)} flights.')
         
     return scenario
\ No newline at end of file
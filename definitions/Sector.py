@@ -1,5 +1,10 @@
 import numpy as np
-from typing import List, Tuple
+from typing import List, Tuple, Union
+try:
+    # Ahead-of-time compiled kernels, built by _kernels_aot.py
+    from .spearhead_kernels import point_in_polygon
+except ImportError:
+    from ._kernels import point_in_polygon
 
 from dotenv import load_dotenv
 import os
@@ -7,6 +12,30 @@ import os
 load_dotenv()
 DEBUG_LEVEL = int(os.getenv('DEBUG_LEVEL', '0'))
 
+_CAPACITY_LIMITS = np.iinfo(np.int16)
+
+
+def _to_capacity_array(values) -> np.ndarray:
+    """
+    Convert capacity values to int16, rejecting values that are not integers in the int16 range.
+    
+    Args:
+        values: Scalar or array of capacity values
+        
+    Returns:
+        The values as an int16 array
+    """
+    values = np.asarray(values)
+    if values.dtype.kind not in 'biuf':
+        raise ValueError("Capacity values must be numeric")
+    if values.size:
+        # NaNs fail the integrality check, infinities the range check
+        if values.dtype.kind == 'f' and not np.all(np.floor(values) == values):
+            raise ValueError("Capacity values must be integers")
+        if values.min() < _CAPACITY_LIMITS.min or values.max() > _CAPACITY_LIMITS.max:
+            raise ValueError(f"Capacity values must be between {_CAPACITY_LIMITS.min} and {_CAPACITY_LIMITS.max}")
+    return values.astype(np.int16, copy=False)
+
 
 class Sector:
     """
@@ -14,37 +43,74 @@ class Sector:
     
     Attributes:
         name (str): The name/identifier of the sector
-        polygon (List[Tuple[float, float]]): List of (latitude, longitude) coordinates defining the sector boundaries
-        capacity (np.ndarray): 96-element array representing 15-minute capacity slots throughout the day
+        polygon (List[Tuple[float, float]] or np.ndarray): (latitude, longitude) coordinates defining the sector boundaries
+        polygon_np (np.ndarray): The polygon as a contiguous (k, 2) float32 array of (latitude, longitude)
+        capacity (np.ndarray): 96-element int16 array representing 15-minute capacity slots throughout the day
         centroid (Tuple[float, float]): The centroid of the sector
     """
+    __slots__ = ('name', 'polygon', 'polygon_np', 'centroid', 'lower_altitude', 'upper_altitude', 'capacity', '_bbox')
     
-    def __init__(self, name: str, polygon: List[Tuple[float, float]], capacity: np.ndarray = None,
+    def __init__(self, name: str, polygon: Union[List[Tuple[float, float]], np.ndarray], capacity: np.ndarray = None,
                  centroid: Tuple[float, float] = None, lower_altitude: float = None, upper_altitude: float = None):
         """
         Initialize a Sector object.
         
         Args:
             name: The sector's name or identifier
-            polygon: List of (latitude, longitude) tuples defining the sector boundaries
+            polygon: List of (latitude, longitude) tuples, or a (k, 2) array, defining the sector boundaries
             capacity: Optional 96-element numpy array for capacity. If None, defaults to zeros
-            centroid: Optional tuple (latitude, longitude) for the sector's centroid
+            centroid: Optional tuple (latitude, longitude) for the sector's centroid. If None, computed from the polygon
             lower_altitude: Optional lower altitude limit for the sector
             upper_altitude: Optional upper altitude limit for the sector
         """
         self.name = name
         self.polygon = polygon
-        self.centroid = centroid
+        self.polygon_np = np.asarray(polygon, dtype=np.float32)
+        if self.polygon_np.shape == (0,):
+            # An empty polygon
+            self.polygon_np = self.polygon_np.reshape(0, 2)
+        if self.polygon_np.ndim != 2 or self.polygon_np.shape[1] != 2:
+            raise ValueError("Polygon must be a k x 2 matrix of (latitude, longitude) pairs")
+        self.centroid = centroid if centroid is not None else self._compute_centroid()
         self.lower_altitude = lower_altitude
         self.upper_altitude = upper_altitude
         
         # Initialize capacity as zeros if not provided
         if capacity is None:
-            self.capacity = np.zeros(96, dtype=int)
+            self.capacity = np.zeros(96, dtype=np.int16)
         else:
             if len(capacity) != 96:
                 raise ValueError("Capacity must be a 96-element array (15-minute intervals for 24 hours)")
-            self.capacity = capacity
+            self.capacity = _to_capacity_array(capacity)
+        
+        # Bounding box (min_lat, max_lat, min_lon, max_lon), used to reject points early.
+        # An empty polygon gets an inverted box that no point falls into.
+        if len(self.polygon_np) == 0:
+            self._bbox = (np.inf, -np.inf, np.inf, -np.inf)
+        else:
+            lower = self.polygon_np.min(axis=0)
+            upper = self.polygon_np.max(axis=0)
+            self._bbox = (float(lower[0]), float(upper[0]), float(lower[1]), float(upper[1]))
+
+    def _compute_centroid(self) -> Tuple[float, float]:
+        """
+        Compute the area centroid (latitude, longitude) of the polygon with the shoelace formula.
+        
+        Falls back to the mean of the vertices for degenerate (zero-area) polygons,
+        and returns None for an empty polygon.
+        """
+        if len(self.polygon_np) == 0:
+            return None
+        lat = self.polygon_np[:, 0].astype(np.float64)
+        lon = self.polygon_np[:, 1].astype(np.float64)
+        lat_next = np.roll(lat, -1)
+        lon_next = np.roll(lon, -1)
+        cross = lon * lat_next - lon_next * lat
+        area = cross.sum() / 2
+        if area == 0:
+            return (float(lat.mean()), float(lon.mean()))
+        return (float(((lat + lat_next) * cross).sum() / (6 * area)),
+                float(((lon + lon_next) * cross).sum() / (6 * area)))
 
     def set_capacity(self, time_index: int, value: int) -> None:
         """
@@ -56,7 +122,7 @@ class Sector:
         """
         if not 0 <= time_index < 96:
             raise ValueError("Time index must be between 0 and 95")
-        self.capacity[time_index] = value
+        self.capacity[time_index] = _to_capacity_array(value)
 
     def get_capacity(self, time_index: int) -> int:
         """
@@ -78,6 +144,30 @@ class Sector:
         """
         return self.centroid
     
+    def get_bbox(self) -> Tuple[float, float, float, float]:
+        """
+        Get the bounding box of the sector (min_lat, max_lat, min_lon, max_lon)
+        """
+        return self._bbox
+
+    def contains_fast(self, lat: float, lon: float) -> bool:
+        """
+        Check whether a point lies inside the sector polygon.
+        
+        Points outside the bounding box are rejected without the full ray-casting test.
+        
+        Args:
+            lat: Latitude of the point
+            lon: Longitude of the point
+            
+        Returns:
+            True if the point is inside the sector
+        """
+        min_lat, max_lat, min_lon, max_lon = self._bbox
+        if not (min_lat <= lat <= max_lat and min_lon <= lon <= max_lon):
+            return False
+        return bool(point_in_polygon(lat, lon, self.polygon_np, 0, len(self.polygon_np)))
+    
     def get_lower_altitude(self) -> float:
         """
         Get the lower altitude limit of the sector
@@ -107,36 +197,51 @@ def load_sectors_from_traffic() -> List[Sector]:
     """
     # Import eurofirs from traffic.data
     from traffic.data import eurofirs
+    from shapely import GeometryType, to_ragged_array
     
     sectors = []
 
     eurofirs_df = eurofirs.data
     
-    # Iterate through each row in the eurofirs dataframe
-    for index, row in eurofirs_df.iterrows():
-        # Extract the polygon coordinates
-        # The geometry is typically in (longitude, latitude) format
-        # but we need (latitude, longitude) for our Sector class
-        polygon = row['geometry'] # shapely polygon
-        # Extract the coordinates
-        polygon_coords = [(lat, lon) for lon, lat in polygon.exterior.coords]
-        
+    # Extract the coordinates of all polygons in one call, as a flat buffer with
+    # ring offsets and per-polygon ring offsets.
+    # The geometry is in (longitude, latitude) format
+    # but we need (latitude, longitude) for our Sector class
+    geometry_type, coords, (ring_offsets, polygon_offsets) = to_ragged_array(eurofirs_df['geometry'].values)
+    if geometry_type != GeometryType.POLYGON:
+        raise ValueError("FIR geometries must all be polygons")
+    all_latlon = coords[:, ::-1].astype(np.float32)
+    
+    # The exterior ring of each polygon is its first ring; empty polygons have none
+    exterior = polygon_offsets[:-1]
+    starts = ring_offsets[exterior]
+    ends = np.where(polygon_offsets[1:] > exterior,
+                    ring_offsets[np.minimum(exterior + 1, len(ring_offsets) - 1)], starts)
+    
+    # Extract the metadata columns once instead of boxing each row
+    designators = eurofirs_df['designator'].to_numpy()
+    latitudes = eurofirs_df['latitude'].to_numpy()
+    longitudes = eurofirs_df['longitude'].to_numpy()
+    lower = eurofirs_df['lower'].to_numpy()
+    upper = eurofirs_df['upper'].to_numpy()
+    
+    for i in range(len(designators)):
         # Create capacity array (default to zeros)
-        capacity = np.zeros(96, dtype=int)
+        capacity = np.zeros(96, dtype=np.int16)
         
         # Create a new Sector object
         sector = Sector(
-            name=row['designator'],  # Use the FIR designator as the name
-            polygon=polygon_coords,
+            name=designators[i],  # Use the FIR designator as the name
+            polygon=all_latlon[starts[i]:ends[i]],  # View into the shared buffer
             capacity=capacity,
-            centroid=(row['latitude'], row['longitude']),
-            lower_altitude=row['lower'],
-            upper_altitude=row['upper']
+            centroid=(latitudes[i], longitudes[i]),
+            lower_altitude=lower[i],
+            upper_altitude=upper[i]
         )
         
         sectors.append(sector)
 
-    if DEBUG_LEVEL >= 2:
+    if __debug__ and DEBUG_LEVEL >= 2:
         print(f'Loaded {len(sectors)} sectors')
 
     return sectors
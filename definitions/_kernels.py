@@ -0,0 +1,84 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional: fall back to running the kernels as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def point_in_polygon(lat: float, lon: float, poly_flat: np.ndarray, start: int, end: int) -> bool:
+    """
+    Crossing-number (ray casting) test of a point against one polygon.
+
+    Args:
+        lat: Latitude of the point
+        lon: Longitude of the point
+        poly_flat: (K, 2) array of (latitude, longitude) vertices of all polygons
+        start: Index of the polygon's first vertex in poly_flat
+        end: Index one past the polygon's last vertex in poly_flat
+
+    Returns:
+        True if the point lies inside the polygon
+    """
+    inside = False
+    j = end - 1
+    for i in range(start, end):
+        lat_i = poly_flat[i, 0]
+        lon_i = poly_flat[i, 1]
+        lat_j = poly_flat[j, 0]
+        lon_j = poly_flat[j, 1]
+        if (lon_i > lon) != (lon_j > lon):
+            lat_cross = lat_i + (lon - lon_i) * (lat_j - lat_i) / (lon_j - lon_i)
+            if lat < lat_cross:
+                inside = not inside
+        j = i
+    return inside
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def classify_points(pts: np.ndarray, poly_flat: np.ndarray, poly_offsets: np.ndarray, bboxes: np.ndarray,
+                    out: np.ndarray) -> None:
+    """
+    Find, for each point, the first polygon that contains it.
+
+    Args:
+        pts: (N, 2) array of (latitude, longitude) points
+        poly_flat: (K, 2) array of (latitude, longitude) vertices of all polygons
+        poly_offsets: (S + 1,) offsets, polygon s is poly_flat[poly_offsets[s]:poly_offsets[s + 1]]
+        bboxes: (S, 4) array of (min_lat, max_lat, min_lon, max_lon) per polygon, checked
+            before the ray-casting test
+        out: (N,) integer array receiving the polygon index of each point, or -1
+    """
+    n_polys = len(poly_offsets) - 1
+    for k in prange(len(pts)):
+        lat = pts[k, 0]
+        lon = pts[k, 1]
+        out[k] = -1
+        for s in range(n_polys):
+            if lat < bboxes[s, 0] or lat > bboxes[s, 1] or lon < bboxes[s, 2] or lon > bboxes[s, 3]:
+                continue
+            if point_in_polygon(lat, lon, poly_flat, poly_offsets[s], poly_offsets[s + 1]):
+                out[k] = s
+                break
+
+
+@njit(cache=True)
+def bulk_set(matrix: np.ndarray, sector_idx: np.ndarray, time_idx: np.ndarray, values: np.ndarray) -> None:
+    """
+    Write values into a (n_sectors, 96) capacity matrix without per-element checks.
+
+    Args:
+        matrix: (n_sectors, 96) capacity matrix to update in place
+        sector_idx: (n,) row index of each update
+        time_idx: (n,) time slot index of each update
+        values: (n,) capacity values to write
+    """
+    for k in range(len(values)):
+        matrix[sector_idx[k], time_idx[k]] = values[k]
@@ -0,0 +1,27 @@
+"""
+Ahead-of-time compilation of the Numba kernels in _kernels.py.
+
+Run from the project root with
+
+    python -m definitions._kernels_aot
+
+to build the spearhead_kernels extension module next to this file. When it is
+present, Scenario and Sector import the compiled kernels from it and skip the
+JIT compilation on first call; otherwise they use the @njit(cache=True) versions.
+Parallel loops run serially in the compiled module.
+"""
+import os
+
+from numba.pycc import CC
+
+from ._kernels import bulk_set, classify_points, point_in_polygon
+
+cc = CC('spearhead_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('point_in_polygon', 'b1(f8, f8, f4[:, :], i8, i8)')(point_in_polygon.py_func)
+cc.export('classify_points', 'void(f4[:, :], f4[:, :], i4[:], f4[:, :], i4[:])')(classify_points.py_func)
+cc.export('bulk_set', 'void(i2[:, :], i8[:], i8[:], i2[:])')(bulk_set.py_func)
+
+if __name__ == '__main__':
+    cc.compile()